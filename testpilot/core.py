@@ -1,8 +1,11 @@
 import os
 import subprocess
 import ast
-import tempfile
-from typing import Dict, List, Tuple, Optional
+import functools
+import hashlib
+import warnings
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple, Optional
 
 from testpilot.llm_providers import get_llm_provider
 
@@ -12,12 +15,123 @@ except ImportError:
     Github = None
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_cached(source_code: str) -> Tuple[Optional[ast.Module],
+                                             Optional[Exception]]:
+    """Return (tree, None) or (None, error) for the given source."""
+    try:
+        return ast.parse(source_code), None
+    except (SyntaxError, ValueError) as e:
+        return None, e
+
+
+def _parse_source(source_code: str) -> ast.Module:
+    """Parse source code, reusing the result for repeated identical input.
+
+    Parse failures are cached as well and re-raised as a fresh exception of
+    the same type. The returned tree is shared between callers and must not
+    be mutated.
+    """
+    tree, error = _parse_cached(source_code)
+    if error is not None:
+        raise type(error)(*error.args)
+    return tree
+
+
+class _Collector:
+    """Fills in a CodeAnalyzer analysis dict in one pass over the tree.
+
+    Nodes come from the iterative ast.walk, so deeply nested source cannot
+    exhaust the recursion limit; handlers are looked up per node type in a
+    dict instead of through an isinstance chain.
+    """
+
+    def __init__(self, analysis: Dict):
+        self.analysis = analysis
+
+    def collect(self, tree: ast.AST) -> None:
+        handlers = self._handlers
+        for node in ast.walk(tree):
+            handler = handlers.get(type(node))
+            if handler is not None:
+                handler(self, node)
+
+    def _function_info(self, node, is_async: bool) -> Dict:
+        return {
+            'name': node.name,
+            'args': [arg.arg for arg in node.args.args],
+            'is_async': is_async,
+            'has_decorators': len(node.decorator_list) > 0,
+            'docstring': ast.get_docstring(node),
+            'returns': node.returns is not None
+        }
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self.analysis['functions'].append(self._function_info(node, False))
+        if node.decorator_list:
+            self.analysis['has_decorators'] = True
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        func_info = self._function_info(node, True)
+        self.analysis['async_functions'].append(func_info)
+        self.analysis['functions'].append(func_info)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        class_info = {
+            'name': node.name,
+            'methods': [],
+            'has_init': False,
+            'docstring': ast.get_docstring(node)
+        }
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef):
+                class_info['methods'].append(item.name)
+                if item.name == '__init__':
+                    class_info['has_init'] = True
+        self.analysis['classes'].append(class_info)
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            if alias.name:
+                self.analysis['imports'].append(alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if node.module:
+            self.analysis['imports'].append(node.module)
+            for alias in node.names:
+                if alias.name:
+                    self.analysis['imports'].append(
+                        f"{node.module}.{alias.name}")
+
+    def visit_Raise(self, node: ast.Raise):
+        self.analysis['has_exceptions'] = True
+
+    def visit_Try(self, node: ast.Try):
+        self.analysis['has_exceptions'] = True
+
+    _handlers = {
+        ast.FunctionDef: visit_FunctionDef,
+        ast.AsyncFunctionDef: visit_AsyncFunctionDef,
+        ast.ClassDef: visit_ClassDef,
+        ast.Import: visit_Import,
+        ast.ImportFrom: visit_ImportFrom,
+        ast.Raise: visit_Raise,
+        ast.Try: visit_Try,
+    }
+
+
 class CodeAnalyzer:
-    """Analyzes Python code to provide context for better test generation."""
+    """Analyzes Python code to provide context for better test generation.
+
+    ``tree`` is the parse result cached for this exact source text and is
+    shared with every other analyzer (and test verifier) given the same
+    source. Treat it as read-only: run ``ast.fix_missing_locations`` or a
+    ``NodeTransformer`` on a ``copy.deepcopy`` of it instead.
+    """
 
     def __init__(self, source_code: str):
         self.source_code = source_code
-        self.tree = ast.parse(source_code)
+        self.tree = _parse_source(source_code)
 
     def analyze(self) -> Dict:
         """Analyze the code and return comprehensive context."""
@@ -34,61 +148,7 @@ class CodeAnalyzer:
             'requirements': []
         }
 
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef):
-                func_info = {
-                    'name': node.name,
-                    'args': [arg.arg for arg in node.args.args],
-                    'is_async': False,
-                    'has_decorators': len(node.decorator_list) > 0,
-                    'docstring': ast.get_docstring(node),
-                    'returns': node.returns is not None
-                }
-                analysis['functions'].append(func_info)
-                if node.decorator_list:
-                    analysis['has_decorators'] = True
-
-            elif isinstance(node, ast.AsyncFunctionDef):
-                func_info = {
-                    'name': node.name,
-                    'args': [arg.arg for arg in node.args.args],
-                    'is_async': True,
-                    'has_decorators': len(node.decorator_list) > 0,
-                    'docstring': ast.get_docstring(node),
-                    'returns': node.returns is not None
-                }
-                analysis['async_functions'].append(func_info)
-                analysis['functions'].append(func_info)
-
-            elif isinstance(node, ast.ClassDef):
-                class_info = {
-                    'name': node.name,
-                    'methods': [],
-                    'has_init': False,
-                    'docstring': ast.get_docstring(node)
-                }
-                for item in node.body:
-                    if isinstance(item, ast.FunctionDef):
-                        class_info['methods'].append(item.name)
-                        if item.name == '__init__':
-                            class_info['has_init'] = True
-                analysis['classes'].append(class_info)
-
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    if alias.name:
-                        analysis['imports'].append(alias.name)
-
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    analysis['imports'].append(node.module)
-                    for alias in node.names:
-                        if alias.name:
-                            analysis['imports'].append(
-                                f"{node.module}.{alias.name}")
-
-            elif isinstance(node, (ast.Raise, ast.Try)):
-                analysis['has_exceptions'] = True
+        _Collector(analysis).collect(self.tree)
 
         # Determine project type and complexity
         analysis['complexity'] = self._determine_complexity(analysis)
@@ -157,24 +217,54 @@ class CodeAnalyzer:
 class CodeTestVerifier:
     """Verifies generated tests for quality and correctness."""
 
+    # Bounded LRU of verification results keyed by (blake2b(test_code),
+    # source_file); verification is deterministic for a given pair.
+    _cache_maxsize = 128
+    _cache: "OrderedDict[Tuple[bytes, str], Tuple]" = OrderedDict()
+
     def __init__(self, test_code: str, source_file: str):
         self.test_code = test_code
         self.source_file = source_file
 
     def verify(self) -> Tuple[bool, List[str], str]:
         """Verify test quality and return (is_valid, issues, corrected_code)."""
+        digest = hashlib.blake2b(self.test_code.encode('utf-8'),
+                                 digest_size=16).digest()
+        key = (digest, self.source_file)
+        cache = CodeTestVerifier._cache
+
+        cached = cache.get(key)
+        if cached is None:
+            is_valid, issues, corrected_code = self._verify_impl()
+            cached = (is_valid, tuple(issues), corrected_code)
+            cache[key] = cached
+            if len(cache) > self._cache_maxsize:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+
+        is_valid, issues, corrected_code = cached
+        return is_valid, list(issues), corrected_code
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all memoized verification results."""
+        cls._cache.clear()
+
+    def _verify_impl(self) -> Tuple[bool, List[str], str]:
+        """Run the uncached verification checks."""
         issues = []
         corrected_code = self.test_code
 
         # Check for syntax errors
         try:
-            ast.parse(self.test_code)
-        except SyntaxError as e:
+            tree = _parse_source(self.test_code)
+        except (SyntaxError, ValueError) as e:
             issues.append(f"Syntax error: {e}")
             return False, issues, corrected_code
 
         # Check for basic test structure
-        if not self._has_test_functions():
+        if not self._has_test_functions(tree):
             issues.append("No test functions found")
 
         # Check for proper imports
@@ -183,21 +273,17 @@ class CodeTestVerifier:
             corrected_code = self._add_missing_imports(corrected_code)
 
         # Try to run the tests in a sandbox
-        is_runnable, run_issues = self._test_runnability()
+        is_runnable, run_issues = self._test_runnability(tree)
         if not is_runnable:
             issues.extend(run_issues)
 
         return len(issues) == 0, issues, corrected_code
 
-    def _has_test_functions(self) -> bool:
-        """Check if the code has test functions."""
-        try:
-            tree = ast.parse(self.test_code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                    return True
-        except (SyntaxError, ValueError):
-            pass
+    def _has_test_functions(self, tree: ast.AST) -> bool:
+        """Check if the already-parsed test code has test functions."""
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
+                return True
         return False
 
     def _has_required_imports(self) -> bool:
@@ -220,41 +306,29 @@ class CodeTestVerifier:
 
         return code
 
-    def _test_runnability(self) -> Tuple[bool, List[str]]:
-        """Test if the generated tests can run without errors."""
+    def _test_runnability(self, tree: ast.AST) -> Tuple[bool, List[str]]:
+        """Test if the already-parsed tests can be compiled without errors."""
         issues = []
 
-        # Create a temporary file to test
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py',
-                                         delete=False) as f:
-            f.write(self.test_code)
-            temp_file = f.name
-
+        # Compile in-process; equivalent to `python -m py_compile` without
+        # writing a temporary file or spawning an interpreter. Compiling the
+        # tree skips a second parse; converting a very deeply nested tree
+        # back to C can exceed the recursion limit where compiling the text
+        # does not, so fall back to the text in that case. Compiler warnings
+        # are ignored, as they were when py_compile ran in a subprocess.
         try:
-            # Try to import the test file
-            result = subprocess.run(
-                ['python3', '-m', 'py_compile', temp_file],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode != 0:
-                issues.append(f"Compilation error: {result.stderr}")
-                return False, issues
-
-        except subprocess.TimeoutExpired:
-            issues.append("Test compilation timed out")
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', SyntaxWarning)
+                try:
+                    compile(tree, '<generated tests>', 'exec')
+                except RecursionError:
+                    compile(self.test_code, '<generated tests>', 'exec')
+        except (SyntaxError, ValueError) as e:
+            issues.append(f"Compilation error: {e}")
             return False, issues
         except Exception as e:
             issues.append(f"Error testing runnability: {str(e)}")
             return False, issues
-        finally:
-            # Clean up
-            try:
-                os.unlink(temp_file)
-            except OSError:
-                pass
 
         return True, issues
 
@@ -374,18 +448,26 @@ Generate only the test code, no explanations:
 
 
 def run_pytest_tests(test_file: str, return_trace: bool = False,
-                     coverage: bool = False) -> Tuple[str, bool, str]:
+                     coverage: bool = False,
+                     runner: Optional[Callable] = None) -> Tuple[str, bool, str]:
     """
     Run pytest on the given test file and return comprehensive results.
     Returns (output, failed, trace) tuple.
+
+    ``runner`` defaults to ``subprocess.run``; any callable with the same
+    signature returning an object with ``stdout``, ``stderr`` and
+    ``returncode`` can be passed to execute tests without spawning a process.
     """
+    if runner is None:
+        runner = subprocess.run
+
     cmd = ['python3', '-m', 'pytest', test_file, '-v']
 
     if coverage:
         cmd.extend(['--cov=.', '--cov-report=term-missing'])
 
     try:
-        result = subprocess.run(
+        result = runner(
             cmd,
             capture_output=True,
             text=True,
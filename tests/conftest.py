@@ -0,0 +1,16 @@
+"""Shared pytest configuration for the TestPilot test suite."""
+
+
+def pytest_configure(config):
+    """Register markers and pre-import modules before the first test runs."""
+    # Register pytest-xdist's grouping marker (used with --dist loadgroup) so
+    # the suite still runs cleanly when pytest-xdist is not installed.
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing a name on one worker"
+    )
+
+    import ast  # noqa: F401
+    import subprocess  # noqa: F401
+    import unittest.mock  # noqa: F401
+
+    import testpilot.core  # noqa: F401